@@ -1,10 +1,11 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import time
 from datetime import datetime
 import sys
 import os
+from collections import deque
 
 # Ensure project root is on path so src/ package resolves
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -21,6 +22,153 @@ from src.agents.recommendation_agent import generate_recommendations
 
 st.set_page_config(page_title="Agentic Grid Management", layout="wide")
 
+# Most recent steps shown in the audit log
+LOG_MAXLEN = 10
+
+# Seconds between simulation ticks while the loop is running
+TICK_SECONDS = 0.15
+
+# Max points per trace sent to the browser for the history chart
+MAX_PLOT_POINTS = 2000
+
+# Per-state series kept for the history charts, and the plan array each
+# one is copied from
+HISTORY_SOURCES = (
+    ("Demand", "load"),
+    ("Solar", "solar"),
+    ("Wind", "wind"),
+    ("Gas", "fuel"),
+    ("Battery", "discharge"),
+    ("Curtailment", "curtailment"),
+    ("Unserved", "unserved"),
+    ("SoC", "soc"),
+)
+
+# The balance bar is a glance indicator: render it static, with no
+# hover/zoom handlers. The history chart keeps zoom but drops unused tools.
+BALANCE_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
+HISTORY_CHART_CONFIG = {
+    "modeBarButtonsToRemove": ["lasso2d", "select2d", "autoScale2d"],
+}
+
+# Supply layers of the history chart, bottom to top
+STACK_TRACES = (
+    ("Solar", "#FDB813"),
+    ("Wind", "#00A4E4"),
+    ("Battery", "#ff9f1c"),
+    ("Gas", "#e71d36"),
+)
+
+# (hours x states) array name -> HourlyAction field
+ACTION_FIELDS = (
+    ("fuel", "fuel_dispatch_mw"),
+    ("unserved", "unserved_mw"),
+    ("curtailment", "curtailment_mw"),
+    ("discharge", "battery_discharge_mw"),
+    ("charge", "battery_charge_mw"),
+    ("soc", "soc_after_mwh"),
+)
+
+
+def plan_to_soa(plan, forecast, states):
+    """Lay out plan and forecast values as (hours x states) float32 arrays.
+
+    Columns follow ``states`` order, so per-hour views are row slices and
+    per-state views are column slices, with no per-hour dict lookups.
+    These feed the charts and audit text only: dollar costs and running
+    totals come from ``plan_hourly_totals``, which stays float64.
+    """
+    hours = len(plan.actions)
+    arrays = {
+        name: np.array(
+            [[getattr(a, field).get(s, 0) for s in states] for a in plan.actions],
+            dtype=np.float32,
+        )
+        for name, field in ACTION_FIELDS
+    }
+    for name in ("load", "solar", "wind"):
+        arrays[name] = np.array(
+            [getattr(forecast.states[s], name)[:hours] for s in states],
+            dtype=np.float32,
+        ).T
+    return arrays
+
+
+def plan_hourly_totals(plan, forecast, states, policy):
+    """Per-hour float64 totals (summed over states) for KPIs and cost.
+
+    Summed from the plan objects in the same order as the original per-step
+    loop, so costs of ~2e7 $/h keep their cents instead of float32 rounding.
+    """
+    totals = {
+        key: []
+        for key in (
+            "fuel", "unserved", "curtailment", "renewable", "load", "discharge",
+            "cost",
+        )
+    }
+    for h, action in enumerate(plan.actions):
+        fuel = unserved = curtailment = renewable = load = discharge = cost = 0.0
+        for s in states:
+            sf = forecast.states[s]
+            f = action.fuel_dispatch_mw.get(s, 0)
+            u = action.unserved_mw.get(s, 0)
+            c = action.curtailment_mw.get(s, 0)
+            fuel += f
+            unserved += u
+            curtailment += c
+            renewable += sf.solar[h] + sf.wind[h] - c
+            load += sf.load[h]
+            discharge += action.battery_discharge_mw.get(s, 0)
+            cost += f * policy.fuel_penalty
+            cost += u * policy.unserved_penalty
+            cost += c * policy.curtailment_penalty
+        totals["fuel"].append(fuel)
+        totals["unserved"].append(unserved)
+        totals["curtailment"].append(curtailment)
+        totals["renewable"].append(renewable)
+        totals["load"].append(load)
+        totals["discharge"].append(discharge)
+        totals["cost"].append(cost)
+    return {key: np.array(vals, dtype=np.float64) for key, vals in totals.items()}
+
+
+@st.cache_data(show_spinner="Running grid pipeline...")
+def _build_pipeline(start_hour: int, num_hours: int, horizon: int):
+    """Run the deterministic agent chain once; reused across sessions and resets."""
+    records = ingest()
+    state_series, battery_configs = build_state_series(
+        records, start_hour=start_hour, num_hours=num_hours
+    )
+    states = sorted(state_series.keys())
+    topology = build_topology(states)
+    forecast = build_forecast(state_series, start_hour=start_hour, horizon=horizon)
+    policy = default_policy()
+    dispatch_plan = run_planner(forecast, topology, battery_configs, policy)
+    kpis = simulate(dispatch_plan, forecast, topology, battery_configs)
+    stress_events = find_stress_windows(dispatch_plan, forecast)
+    recs = generate_recommendations(
+        forecast, topology, battery_configs, policy, kpis
+    )
+    soa = plan_to_soa(dispatch_plan, forecast, states)
+    hourly = plan_hourly_totals(dispatch_plan, forecast, states, policy)
+    return {
+        "forecast": forecast,
+        "dispatch_plan": dispatch_plan,
+        "kpis": kpis,
+        "stress_events": stress_events,
+        "recs": recs,
+        "states": states,
+        "battery_configs": battery_configs,
+        "topology": topology,
+        "policy": policy,
+        "plan_soa": soa,
+        "hourly_totals": hourly,
+        "cost_per_hour": hourly["cost"],
+        "state_index": {name: i for i, name in enumerate(states)},
+    }
+
+
 st.title("⚡ Multi-State Grid Agent")
 st.markdown("""
 This dashboard demonstrates the **Autonomous Grid Balancing** backend.
@@ -35,33 +183,14 @@ if "pipeline_run" not in st.session_state:
     st.session_state.pipeline_run = False
     st.session_state.step_count = 0
     st.session_state.running = False
-    st.session_state.history = []  # list of (hour, action, per_state_snapshot)
+    # Per-state audit-log lines of the newest steps, newest first; charts
+    # read the preallocated history columns instead
+    st.session_state.log_lines = deque(maxlen=LOG_MAXLEN)
 
     try:
-        records = ingest()
-        state_series, battery_configs = build_state_series(
-            records, start_hour=0, num_hours=48
-        )
-        states = sorted(state_series.keys())
-        topology = build_topology(states)
-        forecast = build_forecast(state_series, start_hour=0, horizon=24)
-        policy = default_policy()
-        dispatch_plan = run_planner(forecast, topology, battery_configs, policy)
-        kpis = simulate(dispatch_plan, forecast, topology, battery_configs)
-        stress_events = find_stress_windows(dispatch_plan, forecast)
-        recs = generate_recommendations(
-            forecast, topology, battery_configs, policy, kpis
-        )
-
-        st.session_state.forecast = forecast
-        st.session_state.dispatch_plan = dispatch_plan
-        st.session_state.kpis = kpis
-        st.session_state.stress_events = stress_events
-        st.session_state.recs = recs
-        st.session_state.states = states
-        st.session_state.battery_configs = battery_configs
-        st.session_state.topology = topology
-        st.session_state.policy = policy
+        pipeline = _build_pipeline(start_hour=0, num_hours=48, horizon=24)
+        for key, value in pipeline.items():
+            st.session_state[key] = value
         st.session_state.pipeline_run = True
     except Exception as e:
         st.error(f"Failed to initialize pipeline: {e}")
@@ -77,6 +206,14 @@ if "pipeline_run" not in st.session_state:
         "battery_discharge_mwh": 0.0,
     }
 
+    # Preallocated history columns (hour x state), filled one row per step
+    total_hours = len(st.session_state.dispatch_plan.actions)
+    st.session_state.history_cols = {
+        name: np.zeros((total_hours, len(st.session_state.states)), dtype=np.float32)
+        for name, _ in HISTORY_SOURCES
+    }
+    st.session_state.history_head = 0
+
 
 # ---------------------------------------------------------------------------
 # Sidebar
@@ -85,12 +222,19 @@ st.sidebar.header("Simulation Controls")
 focus_state = st.sidebar.selectbox(
     "Focus State", st.session_state.states, index=st.session_state.states.index("TX")
 )
-is_running = st.sidebar.checkbox(
-    "Start Agentic Loop", value=st.session_state.running
-)
+# The tick fragment cannot untick the checkbox once it is drawn; it asks
+# for it here, at the top of the full rerun it triggers
+if st.session_state.pop("stop_loop", False):
+    st.session_state.running = False
+is_running = st.sidebar.checkbox("Start Agentic Loop", key="running")
+refresh_every = st.sidebar.slider("Steps per tick", 1, 100, 1)
 reset_button = st.sidebar.button("Reset Simulation")
+recompute_button = st.sidebar.button("Recompute Pipeline")
 
-if reset_button:
+if reset_button or recompute_button:
+    # Reset only restarts playback; the cached pipeline is reused as-is
+    if recompute_button:
+        _build_pipeline.clear()
     for key in list(st.session_state.keys()):
         del st.session_state[key]
     st.rerun()
@@ -117,33 +261,24 @@ with tab2:
     st.subheader("Run Metrics")
     metric_placeholder = st.empty()
     st.subheader("Recommendations")
-    rec_placeholder = st.empty()
+    # Fixed for the whole run, so drawn once here rather than every repaint
+    for r in st.session_state.recs[:5]:
+        st.markdown(f"**#{r.rank}** `{r.rec_type}` — {r.description}")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def _compute_step_cost(action, policy, forecast, h, states):
-    """Compute an approximate cost for a single hour from penalties."""
-    cost = 0.0
-    for st in states:
-        cost += action.fuel_dispatch_mw.get(st, 0) * policy.fuel_penalty
-        cost += action.unserved_mw.get(st, 0) * policy.unserved_penalty
-        cost += action.curtailment_mw.get(st, 0) * policy.curtailment_penalty
-    return cost
-
-
-def _explain_step(action, forecast, h, focus):
-    """Generate a one-line explanation for the step."""
-    sf = forecast.states[focus]
-    load = sf.load[h]
-    solar = sf.solar[h]
-    wind = sf.wind[h]
-    fuel = action.fuel_dispatch_mw.get(focus, 0)
-    discharge = action.battery_discharge_mw.get(focus, 0)
-    charge = action.battery_charge_mw.get(focus, 0)
-    curtail = action.curtailment_mw.get(focus, 0)
-    unserved = action.unserved_mw.get(focus, 0)
+def _explain_step(soa, h, fi):
+    """Generate a one-line explanation for the step (state column ``fi``)."""
+    load = soa["load"][h, fi]
+    solar = soa["solar"][h, fi]
+    wind = soa["wind"][h, fi]
+    fuel = soa["fuel"][h, fi]
+    discharge = soa["discharge"][h, fi]
+    charge = soa["charge"][h, fi]
+    curtail = soa["curtailment"][h, fi]
+    unserved = soa["unserved"][h, fi]
 
     parts = [f"Load {load:.0f} MW"]
     if solar + wind > 0:
@@ -161,106 +296,144 @@ def _explain_step(action, forecast, h, focus):
     return " | ".join(parts)
 
 
-def update_ui():
-    """Refresh all visualisation placeholders from session history."""
-    if not st.session_state.history:
-        return
-
-    forecast = st.session_state.forecast
-    policy = st.session_state.policy
-    states = st.session_state.states
-    focus = focus_state
-
-    # Build a dataframe from history
-    rows = []
-    for h, action in st.session_state.history:
-        sf = forecast.states[focus]
-        row = {
-            "hour": h,
-            "Demand": sf.load[h],
-            "Solar": sf.solar[h],
-            "Wind": sf.wind[h],
-            "Gas": action.fuel_dispatch_mw.get(focus, 0),
-            "Battery": action.battery_discharge_mw.get(focus, 0),
-            "Curtailment": action.curtailment_mw.get(focus, 0),
-            "Unserved": action.unserved_mw.get(focus, 0),
-            "SoC": action.soc_after_mwh.get(focus, 0),
-            "Cost": _compute_step_cost(action, policy, forecast, h, states),
-        }
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return
-
-    # --- Live bar chart: supply stack vs demand for latest hour ---
-    last = df.iloc[-1]
-    supply_traces = []
-    for name, color in [
-        ("Gas", "#e71d36"),
-        ("Battery", "#ff9f1c"),
-        ("Wind", "#00A4E4"),
-        ("Solar", "#FDB813"),
-    ]:
-        if last[name] > 0:
-            supply_traces.append(
-                go.Bar(name=name, x=["Supply"], y=[last[name]], marker_color=color)
-            )
-    demand_trace = go.Bar(
-        name="Demand", x=["Demand"], y=[last["Demand"]], marker_color="white"
+def _new_balance_figure():
+    """Latest-hour supply stack vs demand; trace data is filled by update_ui."""
+    fig = go.Figure(
+        data=[go.Bar(name="Demand", x=["Demand"], y=[0], marker_color="white")]
+        + [
+            go.Bar(name=name, x=["Supply"], y=[0], marker_color=color)
+            for name, color in [
+                ("Gas", "#e71d36"),
+                ("Battery", "#ff9f1c"),
+                ("Wind", "#00A4E4"),
+                ("Solar", "#FDB813"),
+            ]
+        ]
     )
-    fig_bar = go.Figure(data=[demand_trace] + supply_traces)
-    fig_bar.update_layout(
+    fig.update_layout(
         barmode="stack",
-        title=f"Hour {int(last['hour'])} — {focus} Balance (MW)",
         height=300,
         yaxis=dict(title="Power (MW)"),
         showlegend=True,
         margin=dict(l=0, r=0, t=30, b=0),
     )
-    dynamics_placeholder.plotly_chart(fig_bar, use_container_width=True)
+    return fig
 
-    # --- Time-series stacked area ---
-    fig_ts = go.Figure()
-    for name, color in [
-        ("Solar", "#FDB813"),
-        ("Wind", "#00A4E4"),
-        ("Battery", "#ff9f1c"),
-        ("Gas", "#e71d36"),
-    ]:
-        fig_ts.add_trace(
-            go.Scatter(
-                x=df["hour"],
-                y=df[name],
+
+def _new_history_figure():
+    """Stacked supply area plus demand line; trace data is filled by update_ui.
+
+    WebGL traces have no stackgroup, so the supply areas are drawn from
+    cumulative sums with fill="tonexty"; hover shows each layer's own value.
+    """
+    fig = go.Figure()
+    for i, (name, color) in enumerate(STACK_TRACES):
+        fig.add_trace(
+            go.Scattergl(
                 mode="lines",
-                stackgroup="one",
+                fill="tozeroy" if i == 0 else "tonexty",
                 name=name,
                 line=dict(width=0, color=color),
+                fillcolor=color,
+                hovertemplate="%{customdata:.0f} MW",
             )
         )
-    fig_ts.add_trace(
-        go.Scatter(
-            x=df["hour"],
-            y=df["Demand"],
+    fig.add_trace(
+        go.Scattergl(
             mode="lines",
             name="Demand",
             line=dict(color="white", width=2, dash="dot"),
         )
     )
-    fig_ts.update_layout(
+    fig.update_layout(
         height=400,
         xaxis=dict(title="Hour"),
         yaxis=dict(title="Power (MW)"),
         margin=dict(l=0, r=0, t=0, b=0),
         hovermode="x unified",
+        # Constant revision: zoom/pan and legend toggles survive repaints.
+        # The balance chart is a static plot, so it has no UI state to keep.
+        uirevision="history",
+    )
+    return fig
+
+
+def _record_history_row(h, soa):
+    """Copy hour ``h`` of the plan arrays into the history columns."""
+    cols = st.session_state.history_cols
+    for name, key in HISTORY_SOURCES:
+        cols[name][h] = soa[key][h]
+    st.session_state.history_head = h + 1
+
+
+def update_ui():
+    """Refresh all visualisation placeholders from session history."""
+    focus = focus_state
+
+    # Slice the filled prefix of the history columns for the focus state
+    n = st.session_state.history_head
+    if n == 0:
+        return
+    fi = st.session_state.state_index[focus]
+    df = pd.DataFrame({
+        "hour": np.arange(n),
+        **{name: arr[:n, fi] for name, arr in st.session_state.history_cols.items()},
+        "Cost": st.session_state.cost_per_hour[:n],
+    })
+
+    # --- Live bar chart: supply stack vs demand for latest hour ---
+    # Figures are built once per session; each tick only swaps trace data.
+    if "fig_bar" not in st.session_state:
+        st.session_state.fig_bar = _new_balance_figure()
+        st.session_state.fig_ts = _new_history_figure()
+
+    # Trace data only changes when a step lands or the focus state changes
+    painted = (n, focus)
+    stale = st.session_state.get("painted") != painted
+    st.session_state.painted = painted
+
+    last = df.iloc[-1]
+    fig_bar = st.session_state.fig_bar
+    if stale:
+        with fig_bar.batch_update():
+            for trace in fig_bar.data:
+                trace.y = [last[trace.name]]
+                if trace.name != "Demand":
+                    trace.visible = bool(last[trace.name] > 0)
+            fig_bar.layout.title.text = (
+                f"Hour {int(last['hour'])} — {focus} Balance (MW)"
+            )
+    dynamics_placeholder.plotly_chart(
+        fig_bar, use_container_width=True, config=BALANCE_CHART_CONFIG
+    )
+
+    # --- Time-series stacked area ---
+    # Stride-decimate long histories (keeping the newest hour) so each
+    # repaint ships at most ~MAX_PLOT_POINTS points per trace.
+    fig_ts = st.session_state.fig_ts
+    if stale:
+        stride = -(-n // MAX_PLOT_POINTS)
+        df_plot = df.iloc[np.unique(np.r_[0:n:stride, n - 1])] if stride > 1 else df
+        x = df_plot["hour"].to_numpy()
+        stack = 0
+        with fig_ts.batch_update():
+            for trace in fig_ts.data:
+                y = df_plot[trace.name].to_numpy()
+                trace.x = x
+                if trace.name == "Demand":
+                    trace.y = y
+                else:
+                    stack = stack + y
+                    trace.y = stack
+                    trace.customdata = y
+    history_placeholder.plotly_chart(
+        fig_ts, use_container_width=True, config=HISTORY_CHART_CONFIG
     )
-    history_placeholder.plotly_chart(fig_ts, use_container_width=True)
 
     # --- Metrics cards ---
-    h_idx = int(last["hour"])
-    action = st.session_state.dispatch_plan.actions[h_idx]
-    sf = forecast.states[focus]
-    renewable_total = sf.solar[h_idx] + sf.wind[h_idx]
+    # Focus-state forecast values come from the history row, not
+    # forecast.states[focus] attribute chains
+    renewable_total = last["Solar"] + last["Wind"]
     supply_total = renewable_total + last["Gas"] + last["Battery"]
     balance_delta = supply_total - last["Demand"]
 
@@ -269,7 +442,7 @@ def update_ui():
         c1.metric("Demand", f"{last['Demand']:.0f} MW")
         c2.metric(
             "Solar / Wind",
-            f"{sf.solar[h_idx]:.0f} / {sf.wind[h_idx]:.0f} MW",
+            f"{last['Solar']:.0f} / {last['Wind']:.0f} MW",
         )
         c3.metric(
             "Balance",
@@ -279,11 +452,11 @@ def update_ui():
         c4.metric("Step Cost", f"${last['Cost']:,.0f}")
 
     # --- Audit logs ---
-    with log_placeholder.container():
-        for h, action in reversed(st.session_state.history[-10:]):
-            explanation = _explain_step(action, forecast, h, focus)
-            cost = _compute_step_cost(action, policy, forecast, h, states)
-            st.text(f"[H{h:02d}] {explanation} | Cost: ${cost:,.0f}")
+    # Lines are formatted once per step; render them in one block
+    log_placeholder.code(
+        "\n".join(lines[fi] for lines in st.session_state.log_lines),
+        language=None,
+    )
 
     # --- Run metrics ---
     rk = st.session_state.running_kpis
@@ -294,70 +467,81 @@ def update_ui():
         m3.metric("Curtailed", f"{rk['total_curtailment_mwh']:,.0f} MWh")
         m4.metric("Renewable Used", f"{rk['total_renewable_mwh']:,.0f} MWh")
 
-    # --- Recommendations ---
-    recs = st.session_state.recs
-    if recs:
-        with rec_placeholder.container():
-            for r in recs[:5]:
-                st.markdown(f"**#{r.rank}** `{r.rec_type}` — {r.description}")
-
 
 # ---------------------------------------------------------------------------
 # Main Run Logic
 # ---------------------------------------------------------------------------
-if is_running:
-    status_text = st.empty()
-
-    step_idx = st.session_state.step_count
+def _advance(steps):
+    """Replay up to ``steps`` planned hours into the running KPIs and history."""
     plan = st.session_state.dispatch_plan
-    forecast = st.session_state.forecast
-    policy = st.session_state.policy
-    states = st.session_state.states
-    total_hours = len(plan.actions)
-
-    while step_idx < total_hours:
-        with status_text.container():
-            st.write(
-                f"**Step {step_idx} / {total_hours}** — _Agents processing..._"
-            )
+    cost_per_hour = st.session_state.cost_per_hour
+    rk = st.session_state.running_kpis
+    soa = st.session_state.plan_soa
+    hourly = st.session_state.hourly_totals
+    step_idx = st.session_state.step_count
+    stop = min(step_idx + steps, len(plan.actions))
+
+    while step_idx < stop:
+        # Accumulate running KPIs from the precomputed float64 hourly totals
+        rk["total_fuel_mwh"] += float(hourly["fuel"][step_idx])
+        rk["total_unserved_mwh"] += float(hourly["unserved"][step_idx])
+        rk["total_curtailment_mwh"] += float(hourly["curtailment"][step_idx])
+        rk["total_renewable_mwh"] += float(hourly["renewable"][step_idx])
+        rk["total_load_mwh"] += float(hourly["load"][step_idx])
+        rk["battery_discharge_mwh"] += float(hourly["discharge"][step_idx])
+
+        # Audit-log line for every state (the focus can change while paused)
+        cost = cost_per_hour[step_idx]
+        lines = [
+            f"[H{step_idx:02d}] {_explain_step(soa, step_idx, i)} | Cost: ${cost:,.0f}"
+            for i in range(len(st.session_state.states))
+        ]
+        st.session_state.log_lines.appendleft(lines)
+        _record_history_row(step_idx, soa)
+        step_idx += 1
+        st.session_state.step_count = step_idx
+
+
+def _stop_loop(error=None):
+    """End the loop with a full-app rerun, which clears the tick's run_every."""
+    st.session_state.stop_loop = True
+    st.session_state.loop_error = error
+    st.rerun()
+
+
+# While running, only this fragment reruns on each tick; the rest of the
+# script (init, sidebar, layout) is not re-executed.
+@st.fragment(run_every=TICK_SECONDS if is_running else None)
+def _tick():
+    if not is_running:
+        return
+    total_hours = len(st.session_state.dispatch_plan.actions)
+    if st.session_state.step_count >= total_hours:
+        _stop_loop()
 
-        time.sleep(0.15)
-
-        try:
-            action = plan.actions[step_idx]
-
-            # Accumulate running KPIs
-            rk = st.session_state.running_kpis
-            for st_name in states:
-                sf = forecast.states[st_name]
-                rk["total_fuel_mwh"] += action.fuel_dispatch_mw.get(st_name, 0)
-                rk["total_unserved_mwh"] += action.unserved_mw.get(st_name, 0)
-                rk["total_curtailment_mwh"] += action.curtailment_mw.get(st_name, 0)
-                rk["total_renewable_mwh"] += (
-                    sf.solar[step_idx]
-                    + sf.wind[step_idx]
-                    - action.curtailment_mw.get(st_name, 0)
-                )
-                rk["total_load_mwh"] += sf.load[step_idx]
-                rk["battery_discharge_mwh"] += action.battery_discharge_mw.get(
-                    st_name, 0
-                )
-
-            st.session_state.history.append((step_idx, action))
-            st.session_state.step_count += 1
-            step_idx += 1
-
-            update_ui()
-
-        except Exception as e:
-            st.error(f"Error at step {step_idx}: {e}")
-            st.session_state.running = False
-            break
-
-    if step_idx >= total_hours:
-        status_text.success("Simulation Complete!")
-        st.session_state.running = False
-
-# Show UI if paused but has history
-if not is_running and st.session_state.history:
+    step_idx = st.session_state.step_count
+    status_placeholder.write(
+        f"**Step {step_idx} / {total_hours}** — _Agents processing..._"
+    )
+    try:
+        # Replay `refresh_every` steps per tick, then repaint once
+        _advance(refresh_every)
+    except Exception as e:
+        _stop_loop(f"Error at step {st.session_state.step_count}: {e}")
     update_ui()
+    if st.session_state.step_count >= total_hours:
+        _stop_loop()
+
+
+status_placeholder = st.empty()
+loop_error = st.session_state.pop("loop_error", None)
+if loop_error:
+    st.error(loop_error)
+_tick()
+
+if not is_running:
+    if st.session_state.step_count >= len(st.session_state.dispatch_plan.actions):
+        status_placeholder.success("Simulation Complete!")
+    # Show UI if paused but has history
+    if st.session_state.history_head:
+        update_ui()
@@ -8,11 +8,11 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 load_dotenv()
 
-from reasoners import grid_router
+from reasoners import grid_router, LLM_SUMMARY_ENABLED
 
 # AI config is optional — only used if ENABLE_LLM_SUMMARY=true
 ai_config = None
-if os.environ.get("ENABLE_LLM_SUMMARY", "false").lower() == "true":
+if LLM_SUMMARY_ENABLED:
     ai_config = AIConfig(
         model="gemini/gemini-2.0-flash",
         temperature=0.3,
@@ -13,16 +13,19 @@ import sys
 import json
 
 # Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
 
-# Load .env (EIA_API_KEY, ENABLE_LLM_SUMMARY, etc.)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # python-dotenv not installed; rely on shell-exported env vars
+# Load .env (EIA_API_KEY, ENABLE_LLM_SUMMARY, etc.); skip importing dotenv
+# entirely when there is no .env to read
+if os.path.exists(os.path.join(ROOT, ".env")):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(os.path.join(ROOT, ".env"))
+    except ImportError:
+        pass  # python-dotenv not installed; rely on shell-exported env vars
 
-from src.agents.orchestrator import run_pipeline
+from src.utils.helpers import env_bool
 
 
 def main():
@@ -52,8 +55,11 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't load the agent chain
+    from src.agents.orchestrator import run_pipeline
+
     # Env var override for LLM
-    enable_llm = args.enable_llm or os.environ.get("ENABLE_LLM_SUMMARY", "false").lower() == "true"
+    enable_llm = args.enable_llm or env_bool("ENABLE_LLM_SUMMARY")
 
     print("=" * 60)
     print("  Grid Load-Balancing MVP")
@@ -2,7 +2,8 @@
 Audit agent: writes structured logs, KPIs, and summary report.
 """
 import json
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from ..schemas.models import (
@@ -16,22 +17,46 @@ from ..schemas.models import (
 from ..utils.helpers import write_json, write_jsonl, LOGS_DIR, REPORTS_DIR
 
 
+# Output directories already created by this process
+_dirs_created = set()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p, skipped for directories this process already created."""
+    if path not in _dirs_created:
+        path.mkdir(parents=True, exist_ok=True)
+        _dirs_created.add(path)
+
+
+# "src->dst" transfer key -> (src, dst). Keys come from a small fixed set
+# of links and repeat every hour, so each is split once per process.
+_split_cache: Dict[str, Tuple[str, str]] = {}
+
+
+def _split(key: str) -> Tuple[str, str]:
+    ends = _split_cache.get(key)
+    if ends is None:
+        src, dst = key.split("->")
+        ends = _split_cache[key] = (src, dst)
+    return ends
+
+
 def write_decisions_log(plan: Plan, log_dir: Path = LOGS_DIR):
     """Write per-hour decisions to decisions.jsonl."""
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_dir)
     records = [action.to_dict() for action in plan.actions]
     write_jsonl(log_dir / "decisions.jsonl", records)
 
 
 def write_kpis(kpis: KPIs, log_dir: Path = LOGS_DIR):
     """Write KPIs to kpis.json."""
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_dir)
     write_json(log_dir / "kpis.json", kpis.to_dict())
 
 
 def write_recommendations(recs: List[Recommendation], log_dir: Path = LOGS_DIR):
     """Write recommendations to recommendations.json."""
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_dir)
     write_json(log_dir / "recommendations.json", [r.to_dict() for r in recs])
 
 
@@ -48,7 +73,7 @@ def write_summary_md(
     provenance: Dict = None,
 ):
     """Write summary.md report with full narrative."""
-    report_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(report_dir)
     states = plan.metadata.get("states", [])
     hours = plan.metadata.get("hours", 24)
 
@@ -58,95 +83,130 @@ def write_summary_md(
     total_transfer = 0.0
     transfer_hours = set()
     fuel_at_cap_count = 0
-    soc_trajectory: Dict[str, List[float]] = {st: [] for st in states}
-    batt_discharge_max: Dict[str, float] = {st: 0.0 for st in states}
+    soc_trajectory: Dict[str, List[float]] = {}
 
     # Per-state renewable totals
     renew_by_state: Dict[str, float] = {}
     load_by_state: Dict[str, float] = {}
 
-    for h, action in enumerate(plan.actions):
-        for st in states:
-            unserved_by_state[st] = unserved_by_state.get(st, 0) + action.unserved_mw.get(st, 0)
-            fuel_by_state[st] = fuel_by_state.get(st, 0) + action.fuel_dispatch_mw.get(st, 0)
-            soc_trajectory[st].append(action.soc_after_mwh.get(st, 0))
-            d = action.battery_discharge_mw.get(st, 0)
-            if d > batt_discharge_max[st]:
-                batt_discharge_max[st] = d
-            if forecast and st in forecast.states:
-                sf = forecast.states[st]
-                renew_by_state[st] = renew_by_state.get(st, 0) + sf.solar[h] + sf.wind[h]
-                load_by_state[st] = load_by_state.get(st, 0) + sf.load[h]
-                # Check fuel at capacity
-                fuel_used = action.fuel_dispatch_mw.get(st, 0)
-                fuel_cap = sf.fuel_capacity[h]
+    # Column-wise: pull each state's hourly series out of the actions once,
+    # then reduce it. Totals accumulate in hour order.
+    actions = plan.actions
+    n_actions = len(actions)
+    # Forecast-derived totals are only worked out when there is a forecast
+    forecast_states = forecast.states if forecast is not None and actions else {}
+    for st in states:
+        unserved_col = [a.unserved_mw.get(st, 0) for a in actions]
+        fuel_col = [a.fuel_dispatch_mw.get(st, 0) for a in actions]
+        soc_trajectory[st] = [a.soc_after_mwh.get(st, 0) for a in actions]
+        if actions:
+            unserved_by_state[st] = sum(unserved_col)
+            fuel_by_state[st] = sum(fuel_col)
+
+        sf = forecast_states.get(st)
+        if sf is not None:
+            ren = 0
+            for solar, wind in zip(sf.solar[:n_actions], sf.wind[:n_actions]):
+                ren = ren + solar + wind
+            renew_by_state[st] = ren
+            load_by_state[st] = sum(sf.load[:n_actions])
+            # Check fuel at capacity
+            for fuel_used, fuel_cap in zip(fuel_col, sf.fuel_capacity):
                 if fuel_cap > 0 and abs(fuel_used - fuel_cap) < 1:
                     fuel_at_cap_count += 1
 
+    # Transfers: totals, per-hour examples (Trade-off 2) and exports by
+    # source state, all from one pass
+    transfer_examples = []
+    export_by_state: Dict[str, float] = defaultdict(int)
+    for h, action in enumerate(actions):
         for key, v in action.transfers_mw.items():
             if v > 0:
                 total_transfer += v
                 transfer_hours.add(h)
+                src, dst = _split(key)
+                transfer_examples.append({"hour": h, "src": src, "dst": dst, "mw": v})
+                export_by_state[src] += v
 
-    renew_pct = (kpis.total_renewable_mwh / kpis.total_load_mwh * 100) if kpis.total_load_mwh > 0 else 0
-    fuel_pct = (kpis.total_fuel_mwh / kpis.total_load_mwh * 100) if kpis.total_load_mwh > 0 else 0
-    unserved_pct = (kpis.total_unserved_mwh / kpis.total_load_mwh * 100) if kpis.total_load_mwh > 0 else 0
+    # Reciprocals of the totals; 0 when a total is empty
+    inv_load = 1.0 / kpis.total_load_mwh if kpis.total_load_mwh > 0 else 0
+    inv_unserved = 1.0 / kpis.total_unserved_mwh if kpis.total_unserved_mwh > 0 else 0
+    renew_pct = kpis.total_renewable_mwh * inv_load * 100
+    fuel_pct = kpis.total_fuel_mwh * inv_load * 100
+    unserved_pct = kpis.total_unserved_mwh * inv_load * 100
     total_state_hours = len(states) * hours
 
-    critical = [e for e in stress_events if e.get("severity") == "critical"]
-    warnings = [e for e in stress_events if e.get("severity") == "warning"]
-
-    # Identify crisis windows (consecutive hours with critical events)
-    critical_hours = sorted(set(e["hour"] for e in critical))
-    morning_events = [e for e in critical if e["hour"] < 12]
-    evening_events = [e for e in critical if e["hour"] >= 12]
-    evening_unserved = sum(e.get("value_mw", 0) for e in evening_events)
-    total_critical_mw = sum(e.get("value_mw", 0) for e in critical)
+    # One pass over stress_events fills every severity / window bucket.
+    # Totals accumulate in event order.
+    critical: List[Dict] = []
+    warnings: List[Dict] = []
+    morning_events: List[Dict] = []
+    evening_events: List[Dict] = []
+    critical_by_state: Dict[str, List[Dict]] = defaultdict(list)
+    morning_states: Dict[str, List[Dict]] = defaultdict(list)
+    worst_hour_events: Dict[int, List[Dict]] = defaultdict(list)  # evening events by hour
+    total_critical_mw = 0
+    morning_total = 0
+    evening_unserved = 0
+    worst_morning = None  # running max; strict > keeps the earliest on ties
+    for e in stress_events:
+        severity = e.get("severity")
+        if severity == "critical":
+            critical.append(e)
+            critical_by_state[e["state"]].append(e)
+            value = e.get("value_mw", 0)
+            total_critical_mw += value
+            # Crisis windows: before noon vs. the evening peak
+            if e["hour"] < 12:
+                morning_events.append(e)
+                morning_states[e["state"]].append(e)
+                morning_total += value
+                if worst_morning is None or e["value_mw"] > worst_morning["value_mw"]:
+                    worst_morning = e
+            else:
+                evening_events.append(e)
+                worst_hour_events[e["hour"]].append(e)
+                evening_unserved += value
+        elif severity == "warning":
+            warnings.append(e)
     evening_pct = (evening_unserved / total_critical_mw * 100) if total_critical_mw > 0 else 0
+    m_hours = sorted(set(e["hour"] for e in morning_events)) if morning_events else []
+    e_hours = sorted(worst_hour_events) if evening_events else []
 
     # SoC at evening peak start
     evening_start_hour = 17
     soc_at_evening: Dict[str, float] = {}
-    for st in states:
-        if len(soc_trajectory[st]) > evening_start_hour:
-            # SoC *before* hour 17 = SoC after hour 16
-            idx = min(evening_start_hour - 1, len(soc_trajectory[st]) - 1)
-            soc_at_evening[st] = soc_trajectory[st][idx] if idx >= 0 else 0
-
-    # Battery idle during evening (discharge = 0)
-    evening_idle = True
-    for h in range(evening_start_hour, min(22, hours)):
-        if h < len(plan.actions):
-            for st in states:
-                if plan.actions[h].battery_discharge_mw.get(st, 0) > 1:
-                    evening_idle = False
-
-    # --- Collect per-hour transfer details for Trade-off 2 examples ---
-    transfer_examples = []
-    for h, action in enumerate(plan.actions):
-        for key, v in action.transfers_mw.items():
-            if v > 0:
-                src, dst = key.split("->")
-                transfer_examples.append({"hour": h, "src": src, "dst": dst, "mw": v})
+    # Every trajectory has one entry per action, so one length check covers
+    # all states. SoC *before* hour 17 = SoC after hour 16.
+    if n_actions > evening_start_hour:
+        idx = evening_start_hour - 1
+        soc_at_evening = {st: soc_trajectory[st][idx] for st in states}
+
+    # Battery idle during evening (discharge = 0); stops at the first discharge
+    evening_idle = not any(
+        action.battery_discharge_mw.get(st, 0) > 1
+        for action in actions[evening_start_hour:min(22, hours)]
+        for st in states
+    )
 
     # --- Build markdown ---
     L = []
 
     # Header
-    L.append("# Grid Load-Balancing MVP — Run Summary")
-    L.append("")
-    L.append(
+    L.extend((
+        "# Grid Load-Balancing MVP — Run Summary",
+        "",
         "This report is the single source of truth for the "
         f"{hours}-hour grid dispatch simulation. It documents what happened, "
         "what trade-offs were made, why blackouts occurred, and what "
         "infrastructure changes would improve outcomes. Every recommendation "
-        "is linked to specific evidence from this run."
-    )
-    L.append("")
-    L.append(f"**Dispatch method**: Greedy {hours}-hour lookahead (deterministic, rule-based)")
-    L.append(f"**Horizon**: {hours} hours")
-    L.append(f"**States**: {', '.join(states)}")
-    L.append("")
+        "is linked to specific evidence from this run.",
+        "",
+        f"**Dispatch method**: Greedy {hours}-hour lookahead (deterministic, rule-based)",
+        f"**Horizon**: {hours} hours",
+        f"**States**: {', '.join(states)}",
+        "",
+    ))
 
     # Data provenance
     if provenance:
@@ -164,85 +224,79 @@ def write_summary_md(
         # Battery assumption note
         batt = provenance.get("battery_assumptions")
         if batt:
-            L.append(
+            L.extend((
                 "*Battery specifications are engineering estimates (not from EIA). "
-                "See provenance sidecar for details.*"
-            )
-            L.append("")
+                "See provenance sidecar for details.*",
+                "",
+            ))
         fuel_method = provenance.get("fuel_capacity_method", "")
         if fuel_method:
-            L.append(f"*Fuel capacity: {fuel_method}.*")
-            L.append("")
-
-    L.append("---")
-    L.append("")
-
-    # What Happened
-    L.append("## What Happened")
-    L.append("")
-    L.append(
-        f"Over a {hours}-hour window, the system dispatched electricity for "
-        f"{len(states)} US states — {', '.join(states)} — drawing on solar and wind "
-        f"generation, battery storage, inter-state transfers, and fossil fuel plants. "
-        f"The objective was to serve all demand while minimizing fuel use, avoiding "
-        f"waste of renewables, and preventing blackouts."
-    )
-    L.append("")
+            L.extend((
+                f"*Fuel capacity: {fuel_method}.*",
+                "",
+            ))
 
-    L.append(
-        f"The grid was **severely supply-constrained**. Renewable generation covered "
-        f"only {renew_pct:.0f}% of total load ({kpis.total_renewable_mwh:,.0f} of "
-        f"{kpis.total_load_mwh:,.0f} MWh). In every single hour, across all three "
-        f"states, demand exceeded the combined output of solar and wind. There was "
-        f"never a surplus of renewable energy to store or share. The remaining "
-        f"{100 - renew_pct:.0f}% of demand fell on batteries, fuel plants, and "
-        f"inter-state transfers."
-    )
-    L.append("")
+    L.extend((
+        "---",
+        "",
+    ))
 
-    L.append(
-        f"Fossil fuel plants bore the heaviest burden, supplying {kpis.total_fuel_mwh:,.0f} MWh "
-        f"({fuel_pct:.0f}% of all load). Even so, fuel plants hit their maximum capacity "
-        f"in {fuel_at_cap_count} out of {total_state_hours} state-hours "
-        f"({hours} hours × {len(states)} states). When demand exceeded "
-        f"even maximum fuel output, the result was **unserved energy — "
-        f"{kpis.total_unserved_mwh:,.0f} MWh of demand that could not be met**, a "
-        f"{unserved_pct:.1f}% overall shortfall."
-    )
+    # What Happened + KPI table: each section is one template; the
+    # conditional sentence is worked out before it.
+    window_note = ""
     if morning_events and evening_events:
-        m_hours = sorted(set(e["hour"] for e in morning_events))
-        e_hours = sorted(set(e["hour"] for e in evening_events))
-        L[-1] += (
+        window_note = (
             f" These blackouts clustered in two distinct windows: "
             f"an early-morning window (hours {m_hours[0]}–{m_hours[-1]}) and a far more "
             f"severe evening-peak window (hours {e_hours[0]}–{e_hours[-1]})."
         )
-    L.append("")
-    L.append("---")
-    L.append("")
+    L.append(f"""## What Happened
 
-    # KPIs
-    L.append("## KPIs")
-    L.append("")
-    L.append(
-        "The following metrics summarize how well the system performed. "
-        "Each is accompanied by an explanation of what drove the result."
-    )
-    L.append("")
-    L.append("| Metric | Value |")
-    L.append("|--------|-------|")
-    L.append(f"| Total Load (MWh) | {kpis.total_load_mwh:,.1f} |")
-    L.append(f"| Renewable Used (MWh) | {kpis.total_renewable_mwh:,.1f} |")
-    L.append(f"| Renewable Utilization | {kpis.renewable_utilization:.1%} |")
-    L.append(f"| Curtailment (MWh) | {kpis.total_curtailment_mwh:,.1f} |")
-    L.append(f"| Fuel Used (MWh) | {kpis.total_fuel_mwh:,.1f} |")
-    L.append(f"| Unserved Energy (MWh) | {kpis.total_unserved_mwh:,.1f} |")
-    L.append(f"| Transfer Utilization | {kpis.transfer_utilization:.1%} |")
-    L.append(f"| Battery Cycles (proxy) | {kpis.battery_cycles_proxy:.2f} |")
-    L.append("")
+Over a {hours}-hour window, the system dispatched electricity for \
+{len(states)} US states — {', '.join(states)} — drawing on solar and wind \
+generation, battery storage, inter-state transfers, and fossil fuel plants. \
+The objective was to serve all demand while minimizing fuel use, avoiding \
+waste of renewables, and preventing blackouts.
+
+The grid was **severely supply-constrained**. Renewable generation covered \
+only {renew_pct:.0f}% of total load ({kpis.total_renewable_mwh:,.0f} of \
+{kpis.total_load_mwh:,.0f} MWh). In every single hour, across all three \
+states, demand exceeded the combined output of solar and wind. There was \
+never a surplus of renewable energy to store or share. The remaining \
+{100 - renew_pct:.0f}% of demand fell on batteries, fuel plants, and \
+inter-state transfers.
+
+Fossil fuel plants bore the heaviest burden, supplying {kpis.total_fuel_mwh:,.0f} MWh \
+({fuel_pct:.0f}% of all load). Even so, fuel plants hit their maximum capacity \
+in {fuel_at_cap_count} out of {total_state_hours} state-hours \
+({hours} hours × {len(states)} states). When demand exceeded \
+even maximum fuel output, the result was **unserved energy — \
+{kpis.total_unserved_mwh:,.0f} MWh of demand that could not be met**, a \
+{unserved_pct:.1f}% overall shortfall.{window_note}
+
+---
+""")
+
+    L.append(f"""## KPIs
 
-    # KPI explanations
-    L.append(
+The following metrics summarize how well the system performed. \
+Each is accompanied by an explanation of what drove the result.
+
+| Metric | Value |
+|--------|-------|
+| Total Load (MWh) | {kpis.total_load_mwh:,.1f} |
+| Renewable Used (MWh) | {kpis.total_renewable_mwh:,.1f} |
+| Renewable Utilization | {kpis.renewable_utilization:.1%} |
+| Curtailment (MWh) | {kpis.total_curtailment_mwh:,.1f} |
+| Fuel Used (MWh) | {kpis.total_fuel_mwh:,.1f} |
+| Unserved Energy (MWh) | {kpis.total_unserved_mwh:,.1f} |
+| Transfer Utilization | {kpis.transfer_utilization:.1%} |
+| Battery Cycles (proxy) | {kpis.battery_cycles_proxy:.2f} |
+""")
+
+    # KPI explanations. Paragraphs that grow conditionally collect their
+    # sentences in a list and are joined once
+    para = [
         f"**Renewable Utilization at {kpis.renewable_utilization:.0%} and "
         f"Curtailment at {kpis.total_curtailment_mwh:,.1f} MWh**: "
         f"These two metrics are linked. Every megawatt-hour of available solar and "
@@ -250,50 +304,69 @@ def write_summary_md(
         f"efficiency. It reflects the fact that demand *always* exceeded renewable "
         f"supply in every hour. There was never a surplus to curtail (waste) or to "
         f"store in batteries."
-    )
+    ]
     if renew_by_state:
-        parts = []
-        for st in sorted(renew_by_state.keys()):
-            ren = renew_by_state[st]
-            ld = load_by_state.get(st, 1)
-            parts.append(f"{st} {ren:,.0f} MWh ({ren / ld * 100:.1f}% of {st} load)")
-        L[-1] += " Renewables provided only " + f"{renew_pct:.0f}% of total load, broken down as: " + ", ".join(parts) + "."
-    L.append("")
+        para.append(
+            f" Renewables provided only {renew_pct:.0f}% of total load, broken down as: "
+            + ", ".join(
+                f"{st} {ren:,.0f} MWh ({ren / load_by_state.get(st, 1) * 100:.1f}% of {st} load)"
+                for st, ren in sorted(renew_by_state.items())
+            )
+            + "."
+        )
+    L.extend((
+        "".join(para),
+        "",
+    ))
 
-    L.append(
+    para = [
         f"**Fuel at {kpis.total_fuel_mwh:,.0f} MWh**: The grid ran primarily on "
         f"fossil fuel."
-    )
+    ]
     if fuel_by_state:
-        parts = [f"{st} ({v:,.0f} MWh)" for st, v in sorted(fuel_by_state.items(), key=lambda x: -x[1])]
-        L[-1] += " By state: " + ", ".join(parts) + "."
-    L[-1] += (
+        para.append(
+            " By state: "
+            + ", ".join(
+                f"{st} ({v:,.0f} MWh)"
+                for st, v in sorted(fuel_by_state.items(), key=lambda x: -x[1])
+            )
+            + "."
+        )
+    para.append(
         f" Fuel plants were at 100% capacity in {fuel_at_cap_count} state-hours — "
         f"including *every* state-hour within both crisis windows. "
         f"This ceiling is the direct cause of all unserved energy: blackouts occurred "
         f"precisely in the hours when fuel plants could produce no more."
     )
-    L.append("")
+    L.extend((
+        "".join(para),
+        "",
+    ))
 
-    L.append(
+    para = [
         f"**Unserved Energy at {kpis.total_unserved_mwh:,.0f} MWh ({unserved_pct:.1f}% of load)**: "
         f"Not evenly distributed."
-    )
+    ]
     if unserved_by_state:
-        parts = []
-        for st in sorted(unserved_by_state.keys(), key=lambda s: -unserved_by_state[s]):
-            v = unserved_by_state[st]
-            pct = v / kpis.total_unserved_mwh * 100 if kpis.total_unserved_mwh > 0 else 0
-            parts.append(f"{st}: {v:,.0f} MWh ({pct:.0f}%)")
-        L[-1] += " " + ", ".join(parts) + "."
-    L[-1] += (
+        para.append(
+            " "
+            + ", ".join(
+                f"{st}: {v:,.0f} MWh ({v * inv_unserved * 100:.0f}%)"
+                for st, v in sorted(unserved_by_state.items(), key=lambda x: -x[1])
+            )
+            + "."
+        )
+    para.append(
         f" Blackouts were concentrated in {len(critical)} critical state-hour events "
         f"(detailed below in Stress Events). The evening peak produced approximately "
         f"{evening_pct:.0f}% of all unserved energy."
     )
-    L.append("")
+    L.extend((
+        "".join(para),
+        "",
+    ))
 
-    L.append(
+    L.extend((
         f"**Transfer Utilization at {kpis.transfer_utilization:.1%}**: Very low. "
         f"The inter-state power lines were used in only {len(transfer_hours)} of "
         f"{hours} hours, transferring a total of {total_transfer:,.0f} MWh. "
@@ -301,60 +374,67 @@ def write_summary_md(
         f"almost every hour. There was rarely surplus power to send. The transfers "
         f"that did occur were \"fuel-backed\": a state with spare fuel capacity "
         f"generated extra power and sent it to a neighbor whose fuel plants were "
-        f"already maxed out."
-    )
-    L.append("")
+        f"already maxed out.",
+        "",
+    ))
 
     # Battery explanation
-    soc_final = {st: soc_trajectory[st][-1] if soc_trajectory[st] else 0 for st in states}
     soc_initial = {}
+    soc_final = {}
     if battery_configs:
         soc_initial = {st: battery_configs[st].initial_soc_mwh for st in states}
-    L.append(
+        soc_final = {st: soc_trajectory[st][-1] if soc_trajectory[st] else 0 for st in states}
+    para = [
         f"**Battery Cycles at {kpis.battery_cycles_proxy:.2f}**: Batteries completed "
         f"roughly one-third of a full discharge cycle over {hours} hours. They were "
         f"*discharge-only* for the entire run — no battery in any state was ever "
         f"charged, because renewable generation never exceeded demand."
-    )
+    ]
     if soc_initial and soc_final:
-        parts = [f"{st}: {soc_initial[st]:,.0f} → {soc_final[st]:,.0f} MWh" for st in states]
-        L[-1] += " State of charge (SoC) dropped monotonically (" + "; ".join(parts) + ")."
+        para.append(
+            " State of charge (SoC) dropped monotonically ("
+            + "; ".join(f"{st}: {soc_initial[st]:,.0f} → {soc_final[st]:,.0f} MWh" for st in states)
+            + ")."
+        )
     if evening_idle:
-        L[-1] += (
+        para.append(
             " Notably, batteries sat completely idle during hours 17–21 due to the "
             "evening reserve policy (explained in the next section)."
         )
-    L.append("")
-    L.append("---")
-    L.append("")
+    L.extend((
+        "".join(para),
+        "",
+        "---",
+        "",
+    ))
 
     # What Trade-Offs Were Made
-    L.append("## What Trade-Offs Were Made")
-    L.append("")
-    L.append(
+    L.extend((
+        "## What Trade-Offs Were Made",
+        "",
         "The dispatch system faced a supply gap in every hour and had to decide how to "
-        "allocate limited batteries and fuel. Three key trade-offs shaped the results."
-    )
-    L.append("")
+        "allocate limited batteries and fuel. Three key trade-offs shaped the results.",
+        "",
+    ))
 
     # Trade-off 1: Battery reserve
-    L.append("### Trade-off 1: Conserving batteries for the evening vs. using them now")
-    L.append("")
+    L.extend((
+        "### Trade-off 1: Conserving batteries for the evening vs. using them now",
+        "",
+    ))
     if battery_configs:
         targets = {st: battery_configs[st].energy_mwh * 0.4 for st in states}
-        target_parts = [f"{st}: {targets[st]:,.0f} MWh" for st in states]
-        L.append(
+        target_list = ", ".join(f"{st}: {targets[st]:,.0f} MWh" for st in states)
+        L.extend((
             f"The system's {hours}-hour lookahead identified the evening peak (hours 17–21) "
             f"as the most critical period and set a **40% state-of-charge (SoC) reserve floor** "
             f"during those hours. This meant batteries should retain at least 40% of their "
-            f"capacity ({', '.join(target_parts)}) to be available for evening dispatch."
-        )
-        L.append("")
-        L.append(
+            f"capacity ({target_list}) to be available for evening dispatch.",
+            "",
             "In practice, batteries discharged at a conservative rate of 150–300 MW per "
-            "state from hours 0 through 16. The result was a slow, steady drain:"
-        )
-        L.append("")
+            "state from hours 0 through 16. The result was a slow, steady drain:",
+            "",
+        ))
         for st in states:
             start_soc = soc_initial.get(st, 0)
             eve_soc = soc_at_evening.get(st, 0)
@@ -365,27 +445,27 @@ def write_summary_md(
                 f"- {st}: {start_soc:,.0f} → {eve_soc:,.0f} MWh by hour 16 "
                 f"({pct:.0f}% of capacity; *{below} the 40% target*)"
             )
-        L.append("")
-        L.append(
+        L.extend((
+            "",
             f"By the time the evening peak arrived at hour 17, **all three states' "
             f"batteries were already below the 40% reserve floor**. The system could "
             f"not discharge them at all. Batteries sat idle from hours 17 through 21 — "
             f"the five hours with the worst blackouts — holding a combined "
-            f"{sum(soc_at_evening.values()):,.0f} MWh that could not be released."
-        )
-        L.append("")
+            f"{sum(soc_at_evening.values()):,.0f} MWh that could not be released.",
+            "",
+        ))
 
         # Hour 22 burst
         if len(plan.actions) > 22:
             h22 = plan.actions[22]
             burst = [f"{st} released {h22.battery_discharge_mw.get(st, 0):,.0f} MW" for st in states if h22.battery_discharge_mw.get(st, 0) > 100]
             if burst:
-                L.append(
+                L.extend((
                     f"The constraint finally lifted at hour 22 (outside the evening peak "
                     f"window), and batteries discharged sharply: {', '.join(burst)} "
-                    f"in a single burst. But by then, the crisis had already passed."
-                )
-                L.append("")
+                    f"in a single burst. But by then, the crisis had already passed.",
+                    "",
+                ))
 
         L.append(
             "**The trade-off**: the reserve policy, designed to protect the evening peak, "
@@ -396,29 +476,25 @@ def write_summary_md(
     L.append("")
 
     # Trade-off 2: Transfers
-    L.append("### Trade-off 2: Helping neighbors vs. serving yourself")
-    L.append("")
+    L.extend((
+        "### Trade-off 2: Helping neighbors vs. serving yourself",
+        "",
+    ))
     # Find dominant exporter
-    export_by_state: Dict[str, float] = {}
-    for action in plan.actions:
-        for key, v in action.transfers_mw.items():
-            if v > 0:
-                src = key.split("->")[0]
-                export_by_state[src] = export_by_state.get(src, 0) + v
     if export_by_state:
         top_exporter = max(export_by_state, key=export_by_state.get)
-        L.append(
+        para = [
             f"{top_exporter}, with the largest fuel fleet, served as the primary "
             f"fuel-backed exporter. In {len(transfer_hours)} of {hours} hours, states "
             f"generated extra fuel power and sent it to neighbors."
-        )
+        ]
         # Add specific examples from transfer_examples
         if transfer_examples:
             # Pick up to 2 representative hours — prefer hours with multiple
             # transfers or those involving the top exporter
-            by_hour = {}
+            by_hour = defaultdict(list)
             for te in transfer_examples:
-                by_hour.setdefault(te["hour"], []).append(te)
+                by_hour[te["hour"]].append(te)
             # Rank hours: prefer multiple transfers, then top-exporter involvement, then earliest
             def _hour_score(h):
                 entries = by_hour[h]
@@ -435,268 +511,265 @@ def write_summary_md(
                     f"at hour {eh} {by_hour[eh][0]['src']} exported {transfers_str}"
                 )
             if example_parts:
-                L[-1] += " For example, " + "; ".join(example_parts) + "."
-        L.append("")
+                para.append(" For example, " + "; ".join(example_parts) + ".")
+        L.extend((
+            "".join(para),
+            "",
+        ))
         # Explain why transfers dropped to zero
-        L.append(
+        L.extend((
             "These fuel-backed transfers reduced shortfalls in receiving states "
             "during the morning window — without them, those states would have "
-            "faced larger blackouts."
-        )
-        L.append("")
-    L.append(
+            "faced larger blackouts.",
+            "",
+        ))
+    L.extend((
         "**The trade-off**: fuel-backed transfers can redistribute generation when one "
         "state's fuel plant is saturated and another's is not. But when all states "
         "saturate simultaneously (as in the evening crisis window), there is no spare "
         "fuel anywhere, and transfers cannot help. This is why transfers dropped to "
-        "zero in the worst hours."
-    )
-    L.append("")
+        "zero in the worst hours.",
+        "",
+    ))
 
     # Trade-off 3: Fuel as last resort
-    L.append("### Trade-off 3: Fuel as the last resort, but the only resort in practice")
-    L.append("")
-    L.append(
+    L.extend((
+        "### Trade-off 3: Fuel as the last resort, but the only resort in practice",
+        "",
         f"The dispatch priority was: use renewables first, then batteries, then "
         f"transfers, then fuel. Fuel was intentionally the last resort because of its "
         f"cost and emissions. However, because renewables covered only {renew_pct:.0f}% "
         f"of load and batteries held limited energy, fuel became the dominant supply "
-        f"source, carrying {fuel_pct:.0f}% of all load."
-    )
-    L.append("")
-    L.append(
+        f"source, carrying {fuel_pct:.0f}% of all load.",
+        "",
         "This \"last resort\" carried the entire grid. When fuel plants hit their "
-        "capacity ceiling, there was no further fallback — the result was blackouts."
-    )
-    L.append("")
-    L.append("---")
-    L.append("")
+        "capacity ceiling, there was no further fallback — the result was blackouts.",
+        "",
+        "---",
+        "",
+    ))
 
     # Stress Events
-    L.append("## Stress Events")
-    L.append("")
-    L.append(
+    L.extend((
+        "## Stress Events",
+        "",
         f"**{len(critical)} critical events** (unserved energy) and "
         f"**{len(warnings)} warnings** were detected "
         f"across {len(stress_events)} total stress events. The {len(warnings)} warnings "
         f"flagged hours where fuel plants exceeded 90% of their maximum capacity — "
         f"a leading indicator that a state was approaching its generation limit. "
-        f"The critical events fell into two clusters."
-    )
-    L.append("")
+        f"The critical events fell into two clusters.",
+        "",
+    ))
 
-    L.append("### Critical Events")
-    L.append("")
-    L.append("| Hour | State | Unserved (MW) |")
-    L.append("|------|-------|--------------|")
-    for e in critical:
-        L.append(f"| {e['hour']} | {e['state']} | {e['value_mw']:,.0f} |")
-    L.append("")
+    if critical:
+        L.extend((
+            "### Critical Events",
+            "",
+            "| Hour | State | Unserved (MW) |",
+            "|------|-------|--------------|",
+            "\n".join(f"| {e['hour']} | {e['state']} | {e['value_mw']:,.0f} |" for e in critical),
+            "",
+        ))
 
     if morning_events:
-        m_hours = sorted(set(e["hour"] for e in morning_events))
-        L.append(f"### Morning window: Hours {m_hours[0]}–{m_hours[-1]} ({len(morning_events)} events)")
-        L.append("")
-        L.append(
+        L.extend((
+            f"### Morning window: Hours {m_hours[0]}–{m_hours[-1]} ({len(morning_events)} events)",
+            "",
             "Before sunrise, solar output was near zero. Load was climbing as the day "
             "began. All three states' fuel plants reached 100% capacity. Batteries were "
-            "discharging, but at conservative 150–270 MW rates to preserve stored energy for the evening."
-        )
-        L.append("")
-        L.append(
+            "discharging, but at conservative 150–270 MW rates to preserve stored energy for the evening.",
+            "",
             "**What caused it**: High pre-dawn load combined with zero solar. "
             "Fuel plants at capacity. Conservative battery dispatch due to the "
-            "evening-reserve lookahead."
-        )
-        L.append("")
-        morning_total = sum(e.get("value_mw", 0) for e in morning_events)
-        L.append(
+            "evening-reserve lookahead.",
+            "",
             "**What decision was made**: The system chose to drain batteries slowly "
             "(preserving them for the evening) rather than discharge aggressively to "
             f"cover the morning gap. This decision directly contributed to the "
-            f"{morning_total:,.0f} MW of morning shortfalls."
-        )
-        L.append("")
+            f"{morning_total:,.0f} MW of morning shortfalls.",
+            "",
+        ))
         # Find which states were hit and worst spike
-        morning_states = {}
-        for e in morning_events:
-            morning_states.setdefault(e["state"], []).append(e)
-        worst_morning = max(morning_events, key=lambda e: e["value_mw"])
         m_state_summary = "; ".join(
             f"{st} was hit in {len(evts)} hour{'s' if len(evts) > 1 else ''}"
             for st, evts in sorted(morning_states.items(), key=lambda x: -len(x[1]))
         )
-        L.append(
+        L.extend((
             f"**What outcome resulted**: {len(morning_events)} critical events totaling "
             f"approximately {morning_total:,.0f} MW of unserved power. {m_state_summary}. "
             f"{worst_morning['state']} had the single largest spike "
-            f"({worst_morning['value_mw']:,.0f} MW at hour {worst_morning['hour']})."
-        )
-        L.append("")
+            f"({worst_morning['value_mw']:,.0f} MW at hour {worst_morning['hour']}).",
+            "",
+        ))
 
     if evening_events:
-        e_hours = sorted(set(e["hour"] for e in evening_events))
-        L.append(
+        L.extend((
             f"### Evening window: Hours {e_hours[0]}–{e_hours[-1]} "
-            f"({len(evening_events)} events, {evening_pct:.0f}% of all unserved energy)"
-        )
-        L.append("")
-        L.append(
+            f"({len(evening_events)} events, {evening_pct:.0f}% of all unserved energy)",
+            "",
             "This was the dominant crisis. Solar generation dropped to zero by hour 20. "
             "Evening load surged. All three states ran fuel plants at 100% capacity "
             "through the entire window. Batteries held stored energy but could not "
             "discharge — all were below the 40% SoC reserve target. Transfers were "
-            "minimal because all states were in deep simultaneous deficit."
-        )
-        L.append("")
+            "minimal because all states were in deep simultaneous deficit.",
+            "",
+        ))
         # Find worst hour
-        worst_hour_events = {}
-        for e in evening_events:
-            worst_hour_events.setdefault(e["hour"], []).append(e)
-        worst_h = max(worst_hour_events, key=lambda h: sum(ev["value_mw"] for ev in worst_hour_events[h]))
-        worst_total = sum(ev["value_mw"] for ev in worst_hour_events[worst_h])
+        hour_totals = {
+            h: sum(ev["value_mw"] for ev in evts) for h, evts in worst_hour_events.items()
+        }
+        worst_h = max(hour_totals, key=hour_totals.get)
+        worst_total = hour_totals[worst_h]
         worst_parts = [f"{e['state']} short {e['value_mw']:,.0f} MW" for e in worst_hour_events[worst_h]]
-        L.append(
+        L.extend((
             f"Hour {worst_h} was the worst overall: {', '.join(worst_parts)} — "
-            f"a combined deficit of {worst_total:,.0f} MW in a single hour."
-        )
-        L.append("")
-        L.append(
+            f"a combined deficit of {worst_total:,.0f} MW in a single hour.",
+            "",
             "**What caused it**: Simultaneous load surge across all states. Solar "
             "dropping to zero. Fuel plants at 100% capacity. Batteries locked by the "
             "40% evening SoC reserve floor. No meaningful transfer options because "
-            "all states were in deficit."
-        )
-        L.append("")
-        evening_total = sum(e.get("value_mw", 0) for e in evening_events)
-        L.append(
+            "all states were in deficit.",
+            "",
             "**What decision was made**: The system honored the 40% SoC reserve floor, "
             f"holding {sum(soc_at_evening.values()):,.0f} MWh in batteries rather than "
             "releasing it during the blackout. The reserve policy prevented any battery "
-            "dispatch for five consecutive hours."
-        )
-        L.append("")
-        L.append(
+            "dispatch for five consecutive hours.",
+            "",
             f"**What outcome resulted**: {len(evening_events)} critical events totaling "
-            f"approximately {evening_total:,.0f} MW of unserved power. This is where the "
+            f"approximately {evening_unserved:,.0f} MW of unserved power. This is where the "
             "vast majority of all blackouts occurred. The locked batteries represent "
-            "energy that *existed* but could not be used."
-        )
-        L.append("")
+            "energy that *existed* but could not be used.",
+            "",
+        ))
 
-    L.append("---")
-    L.append("")
+    L.extend((
+        "---",
+        "",
+    ))
 
-    # Key Constraints
-    L.append("## Key Constraints That Mattered")
-    L.append("")
-    L.append(
-        f"Three constraints drove virtually all of the {kpis.total_unserved_mwh:,.0f} MWh "
-        f"of unserved energy. Understanding which constraints were *binding* (actually "
-        f"limiting the system) and which were *non-binding* (had capacity to spare) is "
-        f"essential for interpreting the recommendations that follow."
-    )
-    L.append("")
-    L.append("**Binding constraints** (directly caused blackouts):")
-    L.append("")
-    L.append(
-        f"1. **Fuel capacity ceiling**: In every one of the {len(critical)} critical "
-        f"events, at least one state's fuel plant was at 100% output. When demand "
-        f"exceeds renewables + batteries + maximum fuel, the difference becomes "
-        f"unserved energy. This was the proximate cause of every blackout."
-    )
-    L.append("")
-    L.append(
-        "2. **Battery energy (MWh) exhaustion**: By hour 17, batteries had discharged "
-        "to ~27% of full capacity — below the 40% evening reserve floor. "
-        "The reserve policy then locked them out entirely for hours 17–21."
-    )
+    # Key Constraints: one template, conditional parts worked out first
+    idle_note = ""
     if soc_at_evening:
-        L[-1] += (
+        idle_note = (
             f" A total of {sum(soc_at_evening.values()):,.0f} MWh sat idle in batteries "
             f"during the worst blackout window."
         )
-    L.append("")
-    L.append(
-        "3. **Simultaneous deficit across all states**: All three states were in net "
-        "deficit (load > renewables) in every single hour. This meant states could "
-        "only help each other by generating *additional* fuel — not by sharing surplus "
-        "renewable energy (there was none). When all fuel plants hit capacity "
-        "simultaneously, inter-state transfers had nothing to move."
-    )
-    L.append("")
-    L.append("**Non-binding constraints** (had spare capacity, not currently limiting):")
-    L.append("")
     if battery_configs:
-        power_parts = [f"{st}: {battery_configs[st].power_mw:,.0f} MW" for st in states]
-        L.append(
+        # Also quoted by the no-impact battery power recommendation below
+        power_limits = ", ".join(f"{st}: {battery_configs[st].power_mw:,.0f} MW" for st in states)
+        power_item = (
             f"4. **Battery power (MW)**: Batteries discharged at 150–300 MW throughout "
-            f"the run, far below their power limits ({', '.join(power_parts)}). "
+            f"the run, far below their power limits ({power_limits}). "
             f"The charge/discharge rate was never the bottleneck."
         )
     else:
-        L.append(
-            "4. **Battery power (MW)**: The charge/discharge rate was never the bottleneck."
-        )
-    L.append("")
-    L.append(
-        f"5. **Transfer line capacity**: Lines were {100 - kpis.transfer_utilization * 100:.1f}% idle. "
-        f"The limitation was not line size but that no state had surplus to send."
-    )
-    L.append("")
-    L.append("---")
-    L.append("")
+        power_item = "4. **Battery power (MW)**: The charge/discharge rate was never the bottleneck."
+    L.append(f"""## Key Constraints That Mattered
+
+Three constraints drove virtually all of the {kpis.total_unserved_mwh:,.0f} MWh \
+of unserved energy. Understanding which constraints were *binding* (actually \
+limiting the system) and which were *non-binding* (had capacity to spare) is \
+essential for interpreting the recommendations that follow.
+
+**Binding constraints** (directly caused blackouts):
+
+1. **Fuel capacity ceiling**: In every one of the {len(critical)} critical \
+events, at least one state's fuel plant was at 100% output. When demand \
+exceeds renewables + batteries + maximum fuel, the difference becomes \
+unserved energy. This was the proximate cause of every blackout.
+
+2. **Battery energy (MWh) exhaustion**: By hour 17, batteries had discharged \
+to ~27% of full capacity — below the 40% evening reserve floor. \
+The reserve policy then locked them out entirely for hours 17–21.{idle_note}
+
+3. **Simultaneous deficit across all states**: All three states were in net \
+deficit (load > renewables) in every single hour. This meant states could \
+only help each other by generating *additional* fuel — not by sharing surplus \
+renewable energy (there was none). When all fuel plants hit capacity \
+simultaneously, inter-state transfers had nothing to move.
+
+**Non-binding constraints** (had spare capacity, not currently limiting):
+
+{power_item}
+
+5. **Transfer line capacity**: Lines were {100 - kpis.transfer_utilization * 100:.1f}% idle. \
+The limitation was not line size but that no state had surplus to send.
+
+---
+""")
 
     # Recommendations
-    L.append("## Top Recommendations")
-    L.append("")
-    L.append(
+    L.extend((
+        "## Top Recommendations",
+        "",
         "Recommendations were generated by running counterfactual simulations: the same "
         f"{hours}-hour scenario was replayed with one infrastructure change, and the "
         "resulting KPIs were compared to the baseline. The **penalty score** is a weighted "
         "sum that quantifies overall grid performance: 1,000 points per MWh of unserved "
         "energy + 10 points per MWh of fuel + 1 point per MWh of curtailment. A negative "
-        "score delta means the change reduces total penalty (improves performance)."
-    )
-    L.append("")
+        "score delta means the change reduces total penalty (improves performance).",
+        "",
+    ))
 
-    # Separate helpful from no-impact recommendations
-    helpful_recs = [r for r in recs if r.kpi_deltas.get("score_delta", 0) < 0]
-    no_impact_recs = [r for r in recs if r.kpi_deltas.get("score_delta", 0) >= 0]
+    # Separate helpful from no-impact recommendations in one pass,
+    # grouping the no-impact ones by type as we go
+    helpful_recs: List[Recommendation] = []
+    no_impact_recs: List[Recommendation] = []
+    power_recs: List[Recommendation] = []
+    transfer_recs: List[Recommendation] = []
+    other_recs: List[Recommendation] = []
+    for r in recs:
+        if r.kpi_deltas.get("score_delta", 0) < 0:
+            helpful_recs.append(r)
+            continue
+        no_impact_recs.append(r)
+        if r.rec_type == "add_battery_power":
+            power_recs.append(r)
+        elif r.rec_type == "add_transfer":
+            transfer_recs.append(r)
+        else:
+            other_recs.append(r)
 
-    # State-level evidence for causal chains
+    # State-level evidence for causal chains. Counts come from the
+    # critical_by_state buckets; the top unserved total is taken once.
+    max_unserved = max(unserved_by_state.values(), default=0)
     state_evidence = {}
     for st in states:
         ev = {
             "unserved": unserved_by_state.get(st, 0),
-            "critical_count": len([e for e in critical if e["state"] == st]),
+            "critical_count": len(critical_by_state.get(st, ())),
             "fuel": fuel_by_state.get(st, 0),
             "renewable": renew_by_state.get(st, 0),
             "load": load_by_state.get(st, 0),
             "soc_evening": soc_at_evening.get(st, 0),
         }
-        if battery_configs and st in battery_configs:
-            ev["batt_energy"] = battery_configs[st].energy_mwh
-            ev["batt_initial"] = battery_configs[st].initial_soc_mwh
-            ev["reserve_target"] = battery_configs[st].energy_mwh * 0.4
+        batt = battery_configs.get(st) if battery_configs else None
+        if batt is not None:
+            ev["batt_energy"] = batt.energy_mwh
+            ev["batt_initial"] = batt.initial_soc_mwh
+            ev["reserve_target"] = batt.energy_mwh * 0.4
         state_evidence[st] = ev
 
     for rec in helpful_recs:
-        score_delta = rec.kpi_deltas.get("score_delta", 0)
-        unserved_delta = rec.kpi_deltas.get("unserved_mwh_delta", 0)
-        fuel_delta = rec.kpi_deltas.get("fuel_mwh_delta", 0)
-        curtailment_delta = rec.kpi_deltas.get("curtailment_mwh_delta", 0)
+        deltas = rec.kpi_deltas
+        score_delta = deltas.get("score_delta", 0)
+        unserved_delta = deltas.get("unserved_mwh_delta", 0)
+        fuel_delta = deltas.get("fuel_mwh_delta", 0)
+        curtailment_delta = deltas.get("curtailment_mwh_delta", 0)
 
-        L.append(f"### #{rec.rank}: {rec.description}")
-        L.append("")
-        L.append(f"**Rank {rec.rank} — score delta: {score_delta:+,.0f} (improvement)**")
-        L.append("")
-        L.append("| Delta | Value |")
-        L.append("|-------|-------|")
-        L.append(f"| Unserved | {unserved_delta:+,.1f} MWh |")
-        L.append(f"| Curtailment | {curtailment_delta:+,.1f} MWh |")
-        L.append(f"| Fuel | {fuel_delta:+,.1f} MWh |")
-        L.append("")
+        L.extend((
+            f"### #{rec.rank}: {rec.description}",
+            "",
+            f"**Rank {rec.rank} — score delta: {score_delta:+,.0f} (improvement)**",
+            "",
+            "| Delta | Value |",
+            "|-------|-------|",
+            f"| Unserved | {unserved_delta:+,.1f} MWh |",
+            f"| Curtailment | {curtailment_delta:+,.1f} MWh |",
+            f"| Fuel | {fuel_delta:+,.1f} MWh |",
+            "",
+        ))
 
         # Causal chain per recommendation type
         st_name = rec.change.get("state", "")
@@ -705,19 +778,19 @@ def write_summary_md(
         if rec.rec_type == "add_storage" and ev:
             # Find which critical hours this state appeared in
             st_critical_hours = sorted(
-                e["hour"] for e in critical if e["state"] == st_name
+                e["hour"] for e in critical_by_state.get(st_name, ())
             )
             hours_str = ", ".join(str(h) for h in st_critical_hours)
 
-            L.append(f"**Why this is recommended — the causal chain**:")
-            L.append("")
-            L.append(
+            L.extend((
+                f"**Why this is recommended — the causal chain**:",
+                "",
                 f"- *Signal*: {st_name} had {ev['unserved']:,.0f} MWh of total unserved "
-                f"energy — {'the most of any state — ' if ev['unserved'] == max(state_evidence[s]['unserved'] for s in states) else ''}"
+                f"energy — {'the most of any state — ' if ev['unserved'] == max_unserved else ''}"
                 f"across {ev['critical_count']} critical events "
                 f"(hours {hours_str}). "
-                f"{st_name}'s fuel plants ran at 100% capacity in every one of those hours."
-            )
+                f"{st_name}'s fuel plants ran at 100% capacity in every one of those hours.",
+            ))
             if "batt_energy" in ev:
                 L.append(
                     f"- *Decision the system made*: {st_name}'s battery ({ev['batt_energy']:,.0f} MWh "
@@ -750,41 +823,39 @@ def write_summary_md(
             L.append("")
 
         elif rec.rec_type == "add_transfer":
-            L.append(f"**Why this recommendation helps**:")
-            L.append("")
-            L.append(
+            L.extend((
+                f"**Why this recommendation helps**:",
+                "",
                 "Larger transfer lines allow more fuel-backed sharing between states. "
-                f"Score improvement: {abs(score_delta):,.0f} points."
-            )
-            L.append("")
+                f"Score improvement: {abs(score_delta):,.0f} points.",
+                "",
+            ))
 
     # No-impact recommendations
     if no_impact_recs:
-        # Group by type
-        power_recs = [r for r in no_impact_recs if r.rec_type == "add_battery_power"]
-        transfer_recs = [r for r in no_impact_recs if r.rec_type == "add_transfer"]
-        other_recs = [r for r in no_impact_recs if r.rec_type not in ("add_battery_power", "add_transfer")]
-
         if power_recs:
             ranks = [str(r.rank) for r in power_recs]
-            L.append(f"### #{', #'.join(ranks)}: Increase battery power (MW) — No impact")
-            L.append("")
-            L.append("| Rank | Change | Score Delta | Unserved Delta | Fuel Delta |")
-            L.append("|------|--------|-------------|----------------|------------|")
+            L.extend((
+                f"### #{', #'.join(ranks)}: Increase battery power (MW) — No impact",
+                "",
+                "| Rank | Change | Score Delta | Unserved Delta | Fuel Delta |",
+                "|------|--------|-------------|----------------|------------|",
+            ))
             for rec in power_recs:
-                score_delta = rec.kpi_deltas.get("score_delta", 0)
+                deltas = rec.kpi_deltas
+                score_delta = deltas.get("score_delta", 0)
+                unserved_delta = deltas.get("unserved_mwh_delta", 0)
+                fuel_delta = deltas.get("fuel_mwh_delta", 0)
                 L.append(
                     f"| {rec.rank} | {rec.description} | {score_delta:+,.1f} | "
-                    f"{rec.kpi_deltas.get('unserved_mwh_delta', 0):+,.1f} MWh | "
-                    f"{rec.kpi_deltas.get('fuel_mwh_delta', 0):+,.1f} MWh |"
+                    f"{unserved_delta:+,.1f} MWh | {fuel_delta:+,.1f} MWh |"
                 )
             L.append("")
             if battery_configs:
-                power_parts = [f"{st}: {battery_configs[st].power_mw:,.0f} MW" for st in states]
                 L.append(
                     "**Why zero impact**: Battery power rating is the maximum charge/discharge "
                     "rate in MW. Throughout this run, batteries discharged at 150–300 MW — well "
-                    f"below their existing power limits ({', '.join(power_parts)}). "
+                    f"below their existing power limits ({power_limits}). "
                     "The bottleneck was not how fast energy could flow out of the battery; it was "
                     "how much stored energy (MWh) was available. "
                     "See **non-binding constraint #4** above: battery power "
@@ -803,19 +874,23 @@ def write_summary_md(
 
         if transfer_recs:
             ranks = [str(r.rank) for r in transfer_recs]
-            L.append(f"### #{', #'.join(ranks)}: Increase transfer capacity — No impact")
-            L.append("")
-            L.append("| Rank | Change | Score Delta | Unserved Delta | Fuel Delta |")
-            L.append("|------|--------|-------------|----------------|------------|")
+            L.extend((
+                f"### #{', #'.join(ranks)}: Increase transfer capacity — No impact",
+                "",
+                "| Rank | Change | Score Delta | Unserved Delta | Fuel Delta |",
+                "|------|--------|-------------|----------------|------------|",
+            ))
             for rec in transfer_recs:
-                score_delta = rec.kpi_deltas.get("score_delta", 0)
+                deltas = rec.kpi_deltas
+                score_delta = deltas.get("score_delta", 0)
+                unserved_delta = deltas.get("unserved_mwh_delta", 0)
+                fuel_delta = deltas.get("fuel_mwh_delta", 0)
                 L.append(
                     f"| {rec.rank} | {rec.description} | {score_delta:+,.1f} | "
-                    f"{rec.kpi_deltas.get('unserved_mwh_delta', 0):+,.1f} MWh | "
-                    f"{rec.kpi_deltas.get('fuel_mwh_delta', 0):+,.1f} MWh |"
+                    f"{unserved_delta:+,.1f} MWh | {fuel_delta:+,.1f} MWh |"
                 )
-            L.append("")
-            L.append(
+            L.extend((
+                "",
                 f"**Why zero impact**: Transfer lines operated at only "
                 f"{kpis.transfer_utilization:.1%} average utilization. Even doubling "
                 f"their capacity produced no improvement because the constraint was "
@@ -823,52 +898,56 @@ def write_summary_md(
                 f"had surplus to send**. With all three states in deficit every hour, "
                 f"and all fuel plants at capacity during crisis windows, larger "
                 f"inter-state lines had nothing additional to move. "
-                f"See **non-binding constraint #5** above."
-            )
-            L.append("")
+                f"See **non-binding constraint #5** above.",
+                "",
+            ))
 
         for rec in other_recs:
             score_delta = rec.kpi_deltas.get("score_delta", 0)
             direction = "no impact" if score_delta == 0 else "worse"
-            L.append(f"### #{rec.rank}: {rec.description} — {direction}")
-            L.append("")
-            L.append(f"{rec.rank}. **{rec.description}** — score delta: {score_delta:+,.1f} ({direction})")
-            L.append("")
+            L.extend((
+                f"### #{rec.rank}: {rec.description} — {direction}",
+                "",
+                f"{rec.rank}. **{rec.description}** — score delta: {score_delta:+,.1f} ({direction})",
+                "",
+            ))
 
-    L.append("---")
-    L.append("")
+    L.extend((
+        "---",
+        "",
+    ))
 
     # Why These Recommendations
-    L.append("## Why These Recommendations — Summary")
-    L.append("")
-    L.append(
+    L.extend((
+        "## Why These Recommendations — Summary",
+        "",
         f"The pattern across all {len(recs)} counterfactual scenarios points to a "
         "single conclusion: **the grid's binding constraint is the total amount of "
         "stored energy (MWh), not the rate of energy flow (MW) or the capacity of "
-        "inter-state connections.**"
-    )
-    L.append("")
+        "inter-state connections.**",
+        "",
+    ))
     if helpful_recs:
-        L.append(
+        L.extend((
             f"Battery energy storage upgrades (recommendations "
             f"#{', #'.join(str(r.rank) for r in helpful_recs)}) help because they "
             f"address the root cause: there is not enough stored energy to bridge the "
             f"gap between daytime renewable generation and evening peak demand, especially "
             f"when fuel plants are already at maximum output. Larger batteries arrive at "
             f"the evening peak with more energy available above the reserve floor, enabling "
-            f"discharge during the critical hours 17–21 when the current batteries sit idle."
-        )
-        L.append("")
+            f"discharge during the critical hours 17–21 when the current batteries sit idle.",
+            "",
+        ))
     if power_recs or transfer_recs:
         no_ranks = [str(r.rank) for r in no_impact_recs]
-        L.append(
+        L.extend((
             f"Battery power upgrades and transfer capacity upgrades "
             f"(#{', #'.join(no_ranks)}) show zero impact because they address "
             f"constraints that are not currently binding. Batteries never hit their "
             f"power limit, and transfer lines are "
-            f"{100 - kpis.transfer_utilization * 100:.0f}% idle."
-        )
-        L.append("")
+            f"{100 - kpis.transfer_utilization * 100:.0f}% idle.",
+            "",
+        ))
     if len(helpful_recs) >= 2:
         rank_explanation_parts = []
         for rec in helpful_recs:
@@ -878,67 +957,69 @@ def write_summary_md(
                 rank_explanation_parts.append(
                     f"{st} ({ev['unserved']:,.0f} MWh unserved, {ev['renewable']:,.0f} MWh renewable)"
                 )
-        L.append(
+        L.extend((
             f"The ranking among the storage recommendations reflects two factors: "
             f"which state has the most unserved energy to reduce, and which state has "
             f"the most renewable energy available to fill the additional storage. "
-            f"By state: {'; '.join(rank_explanation_parts)}."
-        )
-        L.append("")
+            f"By state: {'; '.join(rank_explanation_parts)}.",
+            "",
+        ))
 
-    L.append("---")
-    L.append("")
+    L.extend((
+        "---",
+        "",
+    ))
 
     # Summary of Findings
-    L.append("## Summary of Findings")
-    L.append("")
-    L.append(
+    L.extend((
+        "## Summary of Findings",
+        "",
         f"1. **The grid is fundamentally energy-constrained, not power-constrained.** "
         f"Renewable generation covers {renew_pct:.0f}% of load. The remainder falls on "
         f"fuel, which hits its capacity ceiling in {fuel_at_cap_count} of "
-        f"{total_state_hours} state-hours. Every blackout occurred when fuel was at maximum."
-    )
-    L.append("")
-    L.append(
+        f"{total_state_hours} state-hours. Every blackout occurred when fuel was at maximum.",
+        "",
         "2. **Battery storage is the highest-leverage investment.** All three "
         "top-ranked recommendations add storage (MWh). More storage lets the grid "
         "bank daytime renewables for the evening peak and provides a buffer above the "
         "SoC reserve floor, enabling battery dispatch during the hours when fuel is "
-        "maxed and blackouts occur."
-    )
-    L.append("")
-    L.append(
+        "maxed and blackouts occur.",
+        "",
         f"3. **Battery power and transfer capacity are not current bottlenecks.** "
         f"{len(no_impact_recs)} of {len(recs)} tested scenarios showed zero improvement "
-        f"across all KPIs because neither constraint is binding in this scenario."
-    )
-    L.append("")
-    L.append(
+        f"across all KPIs because neither constraint is binding in this scenario.",
+        "",
         f"4. **The evening peak (hours 17–21) is the dominant risk window**, producing "
         f"{evening_pct:.0f}% of all unserved energy across {len(evening_events)} of "
         f"{len(critical)} critical events. Both crisis windows are driven by the same "
         f"mechanism: fuel at capacity, batteries depleted or locked, and all states in "
-        f"simultaneous deficit."
-    )
-    L.append("")
-    L.append(
+        f"simultaneous deficit.",
+        "",
         "5. **The evening reserve policy created an unintended consequence**: "
         "conservative daytime discharge, intended to save battery for the evening, "
         "depleted SoC below the 40% reserve floor *before* the evening peak began. "
         "Batteries then sat idle during the five worst hours. This suggests the "
         "reserve policy itself may need recalibration — either a lower evening floor, "
         "or a two-stage policy that releases the reserve when fuel plants are fully "
-        "saturated."
-    )
-    L.append("")
+        "saturated.",
+        "",
+    ))
 
     if llm_narrative:
-        L.append("---")
-        L.append("")
-        L.append("## AI Summary (Gemini)")
-        L.append("")
-        L.append(llm_narrative)
-        L.append("")
+        L.extend((
+            "---",
+            "",
+            "## AI Summary (Gemini)",
+            "",
+            llm_narrative,
+            "",
+        ))
 
-    with open(report_dir / "summary.md", "w") as f:
-        f.write("\n".join(L))
+    # Stream the lines through a 1 MiB buffer, newline-separated with no
+    # trailing newline
+    with open(
+        report_dir / "summary.md", "w", encoding="utf-8", newline="", buffering=1 << 20
+    ) as f:
+        lines = iter(L)
+        f.write(next(lines, ""))
+        f.writelines("\n" + line for line in lines)
@@ -23,8 +23,7 @@ def build_forecast(
         window = series[start_hour : start_hour + horizon]
         if len(window) < horizon:
             # pad with last known values
-            while len(window) < horizon:
-                window.append(window[-1])
+            window += [window[-1]] * (horizon - len(window))
 
         sf = StateForecast(
             state=state,
@@ -44,13 +43,21 @@ def add_uncertainty_bands(
     """
     Returns {state: {variable: {"low": [...], "high": [...]}}}
     """
+    # Band factors are loop-invariant; work them out once
+    low_factor = 1 - pct
+    high_factor = 1 + pct
     bands = {}
     for state, sf in forecast.states.items():
-        bands[state] = {}
-        for var_name in ["load", "solar", "wind", "fuel_capacity"]:
-            vals = getattr(sf, var_name)
-            bands[state][var_name] = {
-                "low": [v * (1 - pct) for v in vals],
-                "high": [v * (1 + pct) for v in vals],
+        bands[state] = {
+            var_name: {
+                "low": [v * low_factor for v in vals],
+                "high": [v * high_factor for v in vals],
             }
+            for var_name, vals in (
+                ("load", sf.load),
+                ("solar", sf.solar),
+                ("wind", sf.wind),
+                ("fuel_capacity", sf.fuel_capacity),
+            )
+        }
     return bands
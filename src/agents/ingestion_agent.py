@@ -11,6 +11,8 @@ path was taken.
 import csv
 import json
 import os
+import pickle
+from dataclasses import fields
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -21,13 +23,84 @@ from ..utils.helpers import DATA_PROCESSED
 # Default processed file written by the EIA client
 _DEFAULT_CSV = DATA_PROCESSED / "eia_hourly.csv"
 _PROVENANCE_JSON = DATA_PROCESSED / "eia_hourly.provenance.json"
+# Parsed-record cache (pickled), keyed by the CSV's path, mtime and size
+# plus the GridState field layout
+_RECORDS_CACHE_DIR = DATA_PROCESSED / ".cache"
 
 
-def _load_csv(filepath: str | Path) -> List[Dict]:
-    """Load a CSV into a list of dicts."""
+def _load_csv(filepath: str | Path) -> List[GridState]:
+    """
+    Parse the processed CSV straight into GridState records.
+
+    Rows are streamed with csv.reader and converted by column position, so
+    no per-row dict is built.
+    """
     with open(filepath, newline="") as f:
-        reader = csv.DictReader(f)
-        return [row for row in reader]
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        col = {name: i for i, name in enumerate(header)}
+        i_state = col["state"]
+        i_hour = col["hour"]
+        i_load = col["load_mw"]
+        i_solar = col["solar_mw"]
+        i_wind = col["wind_mw"]
+        i_fuel = col["fuel_capacity_mw"]
+        i_power = col["battery_power_mw"]
+        i_energy = col["battery_energy_mwh"]
+        i_eff = col["battery_efficiency"]
+        i_soc = col["battery_initial_soc_mwh"]
+        return [
+            GridState(
+                state=row[i_state],
+                hour=int(row[i_hour]),
+                load_mw=float(row[i_load]),
+                solar_mw=float(row[i_solar]),
+                wind_mw=float(row[i_wind]),
+                fuel_capacity_mw=float(row[i_fuel]),
+                battery_power_mw=float(row[i_power]),
+                battery_energy_mwh=float(row[i_energy]),
+                battery_efficiency=float(row[i_eff]),
+                battery_soc_mwh=float(row[i_soc]),
+            )
+            for row in reader
+            if row  # skip blank lines (csv.reader yields [] for them)
+        ]
+
+
+def _load_records(csv_path: Path) -> List[GridState]:
+    """
+    _load_csv memoized on disk, so repeat runs skip re-parsing the CSV.
+
+    The pickle stores the (path, mtime_ns, size) it was built from and the
+    GridState field names; any change to the CSV or to GridState makes the
+    entry stale and it is rebuilt.
+    """
+    stat = csv_path.stat()
+    key = (
+        str(csv_path.resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+        tuple(f.name for f in fields(GridState)),
+    )
+    cache_path = _RECORDS_CACHE_DIR / f"{csv_path.stem}.records.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, records = pickle.load(f)
+        if cached_key == key:
+            return records
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+        pass  # missing, unreadable, or from an older GridState: reparse
+
+    records = _load_csv(csv_path)
+    try:
+        _RECORDS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, records), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only checkout: just skip caching
+    return records
 
 
 def _ensure_processed_csv(csv_path: Path) -> Path:
@@ -67,26 +140,10 @@ def ingest(data_dir: str = None) -> List[GridState]:
 
     csv_path = _ensure_processed_csv(csv_path)
 
-    rows = _load_csv(csv_path)
-    if not rows:
+    all_records = _load_records(csv_path)
+    if not all_records:
         raise FileNotFoundError(f"Processed CSV is empty: {csv_path}")
 
-    all_records: List[GridState] = []
-    for row in rows:
-        gs = GridState(
-            state=row["state"],
-            hour=int(row["hour"]),
-            load_mw=float(row["load_mw"]),
-            solar_mw=float(row["solar_mw"]),
-            wind_mw=float(row["wind_mw"]),
-            fuel_capacity_mw=float(row["fuel_capacity_mw"]),
-            battery_power_mw=float(row["battery_power_mw"]),
-            battery_energy_mwh=float(row["battery_energy_mwh"]),
-            battery_efficiency=float(row["battery_efficiency"]),
-            battery_soc_mwh=float(row["battery_initial_soc_mwh"]),
-        )
-        all_records.append(gs)
-
     return all_records
 
 
@@ -138,7 +138,8 @@ def _get_llm_summary(kpis: KPIs, recs, stress_events) -> Optional[str]:
         "critical_count": len([e for e in stress_events if e.get("severity") == "critical"]),
     }
     context_str = json.dumps(context, sort_keys=True)
-    cache_key = hashlib.md5(context_str.encode()).hexdigest()
+    # The same canonical string is the prompt payload, so hash it as-is
+    cache_key = hashlib.blake2b(context_str.encode(), digest_size=16).hexdigest()
     cache_path = cache_dir / f"{cache_key}.txt"
 
     if cache_path.exists():
@@ -53,13 +53,19 @@ def _build_soc_target_curve(
 
     for st, batt in battery_configs.items():
         t = []
-        total_future_scarcity = sum(scarcity[st])
-        for h in range(hours):
-            # Base minimum
-            base_min = batt.energy_mwh * policy.min_soc_fraction
+        # Base minimum
+        base_min = batt.energy_mwh * policy.min_soc_fraction
+
+        # Suffix sums: remaining_scarcity[h] == sum(scarcity[st][h:]),
+        # built in one backward pass instead of re-summing every hour
+        remaining_scarcity = [0.0] * (len(scarcity[st]) + 1)
+        for i in range(len(scarcity[st]) - 1, -1, -1):
+            remaining_scarcity[i] = remaining_scarcity[i + 1] + scarcity[st][i]
+        total_future_scarcity = remaining_scarcity[0]
 
+        for h in range(hours):
             # Future scarcity ratio: how much scarcity remains after this hour
-            remaining = sum(scarcity[st][h:])
+            remaining = remaining_scarcity[min(h, len(scarcity[st]))]
             if total_future_scarcity > 0:
                 future_ratio = remaining / total_future_scarcity
             else:
@@ -94,6 +100,16 @@ def plan(
     scarcity = _compute_scarcity_scores(forecast, states)
     soc_targets = _build_soc_target_curve(scarcity, battery_configs, policy, hours)
 
+    # Bind per-state series once rather than chasing forecast.states[st]
+    # attributes inside the hourly loop
+    renewable_by_state: Dict[str, List[float]] = {
+        st: [s + w for s, w in zip(forecast.states[st].solar, forecast.states[st].wind)]
+        for st in states
+    }
+    load_by_state = {st: forecast.states[st].load for st in states}
+    fuel_cap_by_state = {st: forecast.states[st].fuel_capacity for st in states}
+    get_capacity = topology.get_capacity
+
     # Initialize SoC
     soc: Dict[str, float] = {st: battery_configs[st].initial_soc_mwh for st in states}
     actions: List[HourlyAction] = []
@@ -104,9 +120,7 @@ def plan(
         # Step 1: compute net position per state (renewable - load)
         net: Dict[str, float] = {}
         for st in states:
-            sf = forecast.states[st]
-            renewable = sf.solar[h] + sf.wind[h]
-            net[st] = renewable - sf.load[h]
+            net[st] = renewable_by_state[st][h] - load_by_state[st][h]
             action.curtailment_mw[st] = 0.0
             action.battery_charge_mw[st] = 0.0
             action.battery_discharge_mw[st] = 0.0
@@ -158,7 +172,7 @@ def plan(
             for i, (src, s_avail) in enumerate(surplus_states):
                 if remaining_need <= 0 or s_avail <= 0:
                     continue
-                cap = topology.get_capacity(src, dst)
+                cap = get_capacity(src, dst)
                 transfer = min(remaining_need, s_avail, cap)
                 if transfer > 0:
                     key = f"{src}->{dst}"
@@ -175,7 +189,7 @@ def plan(
         for st in states:
             if net[st] < 0:
                 deficit = -net[st]
-                fuel_cap = forecast.states[st].fuel_capacity[h]
+                fuel_cap = fuel_cap_by_state[st][h]
                 fuel = min(deficit, fuel_cap)
                 action.fuel_dispatch_mw[st] = round(fuel, 2)
                 fuel_used_this_hour[st] = fuel
@@ -193,10 +207,10 @@ def plan(
             for src in states:
                 if src == dst or remaining_need <= 0:
                     continue
-                spare_fuel = forecast.states[src].fuel_capacity[h] - fuel_used_this_hour[src]
+                spare_fuel = fuel_cap_by_state[src][h] - fuel_used_this_hour[src]
                 if spare_fuel <= 0:
                     continue
-                cap = topology.get_capacity(src, dst)
+                cap = get_capacity(src, dst)
                 # Subtract any existing transfers on this link
                 key = f"{src}->{dst}"
                 already = action.transfers_mw.get(key, 0)
@@ -1,17 +1,18 @@
 """
 Core data models for the grid load-balancing MVP.
 All schemas use dataclasses for zero external dependencies.
+Records created per row/hour use slots to avoid a per-instance __dict__.
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 
 
 # ---------------------------------------------------------------------------
 # Per state-hour snapshot
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class GridState:
     """Single hour observation for one state."""
     state: str
@@ -49,28 +50,38 @@ class ForecastPack:
 # ---------------------------------------------------------------------------
 # Transfer link
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransferLink:
+    """Directed link; immutable so topologies can be shared and hashed."""
     from_state: str
     to_state: str
     capacity_mw: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransferTopology:
-    links: List[TransferLink] = field(default_factory=list)
+    """Immutable link set; build a new topology to change capacities."""
+    links: Tuple[TransferLink, ...] = ()
+    # (from_state, to_state) -> capacity, built once from links
+    _capacity: Dict[Tuple[str, str], float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Any iterable of links is accepted and stored as a tuple
+        object.__setattr__(self, "links", tuple(self.links))
+        for link in self.links:
+            # The first link listed for a state pair sets its capacity
+            self._capacity.setdefault((link.from_state, link.to_state), link.capacity_mw)
 
     def get_capacity(self, from_state: str, to_state: str) -> float:
-        for link in self.links:
-            if link.from_state == from_state and link.to_state == to_state:
-                return link.capacity_mw
-        return 0.0
+        return self._capacity.get((from_state, to_state), 0.0)
 
 
 # ---------------------------------------------------------------------------
 # Hourly action (decision)
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class HourlyAction:
     """Dispatch decision for one hour across all states."""
     hour: int
@@ -175,8 +186,9 @@ class BatteryConfig:
 # ---------------------------------------------------------------------------
 # Policy weights / constraints
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PolicyConfig:
+    """Immutable, so the default policy can be shared as a single instance."""
     unserved_penalty: float = 1000.0
     curtailment_penalty: float = 1.0
     fuel_penalty: float = 10.0
@@ -35,6 +35,11 @@ def simulate(
     total_transfer_capacity = 0.0
     total_discharge = 0.0
     total_battery_capacity = sum(b.energy_mwh for b in battery_configs.values())
+    # Transfer keys are fixed per topology; build them once, not every hour
+    link_keys = [
+        (f"{link.from_state}->{link.to_state}", link.capacity_mw)
+        for link in topology.links
+    ]
 
     for h in range(min(hours, len(plan.actions))):
         action = plan.actions[h]
@@ -60,11 +65,10 @@ def simulate(
             total_discharge += action.battery_discharge_mw.get(st, 0)
 
         # Transfer utilization
-        for link in topology.links:
-            key = f"{link.from_state}->{link.to_state}"
+        for key, capacity_mw in link_keys:
             used = action.transfers_mw.get(key, 0)
             total_transfer_used += used
-            total_transfer_capacity += link.capacity_mw
+            total_transfer_capacity += capacity_mw
 
     re_util = (total_renewable_used / total_renewable_available) if total_renewable_available > 0 else 1.0
     tr_util = (total_transfer_used / total_transfer_capacity) if total_transfer_capacity > 0 else 0.0
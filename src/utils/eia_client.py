@@ -12,6 +12,7 @@ Data source: Form EIA-930, Hourly Electric Grid Monitor
 import csv
 import json
 import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -224,11 +225,24 @@ def build_processed_csv(
     if start is None or end is None:
         start, end = _default_time_range(hours)
 
+    # The two endpoints are independent, so fetch them concurrently — wall
+    # time becomes the slower of the two requests rather than their sum.
     print(f"  Fetching EIA fuel-type data ({start} → {end}) …")
-    fuel_rows = fetch_fuel_type_data(RESPONDENTS, start, end, api_key)
-
     print(f"  Fetching EIA demand data ({start} → {end}) …")
-    demand_rows = fetch_demand_data(RESPONDENTS, start, end, api_key)
+    # A failed fetch is raised as soon as it happens, without waiting for
+    # the other request (which may be sleeping through 429 back-off).
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        fuel_future = pool.submit(fetch_fuel_type_data, RESPONDENTS, start, end, api_key)
+        demand_future = pool.submit(fetch_demand_data, RESPONDENTS, start, end, api_key)
+        wait((fuel_future, demand_future), return_when=FIRST_EXCEPTION)
+        for future in (fuel_future, demand_future):
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+        fuel_rows = fuel_future.result()
+        demand_rows = demand_future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     # --- Organise raw records by (respondent, period) ---
     # fuel_map[respondent][period] = {fueltype: value_mw, ...}
@@ -3,6 +3,11 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson  # optional C parser for read_json; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
@@ -12,22 +17,43 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 RUNS_DIR = PROJECT_ROOT / "runs"
 
 
+def env_bool(name, default=False):
+    """Parse a boolean env var ("1", "true", "yes", "on"; case-insensitive)."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def ensure_dirs():
     for d in [DATA_RAW, DATA_PROCESSED, LOGS_DIR, REPORTS_DIR, RUNS_DIR]:
         d.mkdir(parents=True, exist_ok=True)
 
 
 def write_json(path, data):
+    # Stays on stdlib json: orjson differs on non-ASCII, float spelling
+    # (1e-05 -> 0.00001), NaN (-> null) and non-str keys (TypeError).
+    # dumps + one write; json.dump would issue a write per encoder chunk
     with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, indent=2))
 
 
 def write_jsonl(path, records):
+    # Serialize everything first, then hand the file a single write.
+    # Stays on stdlib json: orjson has no ", " / ": " separators, so it
+    # would rewrite every line of the tracked decisions log.
+    data = "".join(json.dumps(r) + "\n" for r in records)
     with open(path, "w") as f:
-        for r in records:
-            f.write(json.dumps(r) + "\n")
+        f.write(data)
 
 
 def read_json(path):
+    if orjson is not None:
+        data = Path(path).read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN / Infinity, which stdlib json writes but orjson rejects
+            return json.loads(data)
     with open(path) as f:
         return json.load(f)